@@ -17,6 +17,7 @@ from brainbox.core import Bunch
 from ibllib.io import jsonable
 
 logger_ = logging.getLogger('ibllib')
+UUID_PATTERN = re.compile(r'^[\da-f]{8}-([\da-f]{4}-){3}[\da-f]{12}$', re.IGNORECASE)
 
 
 def _find_metadata(file_alf):
@@ -292,12 +293,6 @@ def is_uuid_string(string):
     """
     Bool test to c
     """
-    if string is None:
-        return False
-    if len(string) != 36:
-        return False
-    UUID_PATTERN = re.compile(r'^[\da-f]{8}-([\da-f]{4}-){3}[\da-f]{12}$', re.IGNORECASE)
-    if UUID_PATTERN.match(string):
-        return True
-    else:
+    if string is None or len(string) != 36:
         return False
+    return UUID_PATTERN.match(string) is not None
@@ -2,7 +2,6 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 from oneibl.one import ONE
-from ibllib.time import isostr2date
 
 # import sys
 # sys.path.extend('/home/owinter/PycharmProjects/WGs/BehaviourAnaysis/python')
@@ -17,7 +16,7 @@ subject_details = one.alyx.rest('subjects', 'read', 'IBL_14')
 # plot the weight curve
 # https://alyx.internationalbrainlab.org/admin-actions/water-history/37c8f897-cbcc-4743-bad6-764ccbbfb190
 wei = pd.DataFrame(subject_details['weighings'])
-wei['date_time'].apply(isostr2date)
+wei['date_time'] = pd.to_datetime(wei['date_time'])
 wei.sort_values('date_time', inplace=True)
 plt.plot(wei.date_time, wei.weight)
 
@@ -253,8 +253,9 @@ def _assign_events_to_trial(t_trial_start, t_event, take='last'):
 
 
 def _get_sync_fronts(sync, channel_nb):
-    return Bunch({'times': sync['times'][sync['channels'] == channel_nb],
-                  'polarities': sync['polarities'][sync['channels'] == channel_nb]})
+    selection = sync['channels'] == channel_nb
+    return Bunch({'times': sync['times'][selection],
+                  'polarities': sync['polarities'][selection]})
 
 
 def extract_camera_sync(sync, output_path=None, save=False, chmap=None):
@@ -411,6 +412,7 @@ def extract_sync(session_path, save=False, force=False, ephys_files=None):
     :param session_path: '/path/to/subject/yyyy-mm-dd/001'
     :param save: Bool, defaults to False
     :param force: Bool on re-extraction, forces overwrite instead of loading existing sync files
+    :param ephys_files: (optional) output of glob_ephys_files, avoids globbing the session again
     :return: list of sync dictionaries
     """
     session_path = Path(session_path)
@@ -437,7 +439,7 @@ def _get_all_probes_sync(session_path):
     # round-up of all bin ephys files in the session, infer revision and get sync map
     ephys_files = glob_ephys_files(session_path)
     version = get_neuropixel_version_from_files(ephys_files)
-    extract_sync(session_path, save=True)
+    extract_sync(session_path, save=True, ephys_files=ephys_files)
     # attach the sync information to each binary file found
     for ef in ephys_files:
         ef['sync'] = alf.io.load_object(ef.path, '_spikeglx_sync', short_keys=True)
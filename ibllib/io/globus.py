@@ -1,8 +1,12 @@
-import globus_sdk as globus
+"""
+Globus login helpers. globus_sdk is slow to import so it is imported within the functions,
+rather than each time `import ibllib` loads this module.
+"""
 from ibllib.io import params
 
 
 def _login(globus_client_id, refresh_tokens=False):
+    import globus_sdk as globus
 
     client = globus.NativeAppAuthClient(globus_client_id)
     client.oauth2_start_flow(refresh_tokens=refresh_tokens)
@@ -23,6 +27,7 @@ def _login(globus_client_id, refresh_tokens=False):
 
 
 def login(globus_client_id):
+    import globus_sdk as globus
     token = _login(globus_client_id, refresh_tokens=False)
     authorizer = globus.AccessTokenAuthorizer(token['transfer_token'])
     tc = globus.TransferClient(authorizer=authorizer)
@@ -37,6 +42,7 @@ def setup(globus_client_id, str_app='globus'):
 
 
 def login_auto(globus_client_id, str_app='globus'):
+    import globus_sdk as globus
     token = params.read(str_app)
     if not token:
         raise ValueError("Token file doesn't exist, run ibllib.io.globus.setup first")
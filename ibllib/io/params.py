@@ -1,7 +1,10 @@
 import collections
+import copy
+import functools
 import pathlib
 import sys
 import os
+import stat
 import json
 
 
@@ -48,6 +51,16 @@ def getfile(str_params):
     return pfile
 
 
+@functools.lru_cache(maxsize=32)
+def _read_json(pfile, mtime_ns, size):
+    """
+    Parses a Json parameter file. The modification time and size are part of the cache key
+    so that a file re-written on disk is parsed again.
+    """
+    with open(pfile) as fil:
+        return json.load(fil)
+
+
 def read(str_params, default=None):
     """
     Reads in and parse Json parameter file into dictionary
@@ -57,9 +70,16 @@ def read(str_params, default=None):
     :return: named tuple containing parameters
     """
     pfile = getfile(str_params)
-    if os.path.isfile(pfile):
-        with open(pfile) as fil:
-            par_dict = json.loads(fil.read())
+    # a single stat call tells both if the file exists and if there is anything to parse
+    try:
+        st = os.stat(pfile)
+    except FileNotFoundError:
+        st = None
+    if st and stat.S_ISREG(st.st_mode) and st.st_size > 0:
+        # the cached dictionary is shared: copy it as the caller may add default keys.
+        # Parameters are mostly flat so only nested containers need a deep copy
+        par_dict = {k: copy.deepcopy(v) if isinstance(v, (list, dict)) else v
+                    for k, v in _read_json(pfile, st.st_mtime_ns, st.st_size).items()}
     else:
         par_dict = as_dict(default)
     # without default parameters
@@ -69,7 +89,7 @@ def read(str_params, default=None):
     if not default or default.keys() == par_dict.keys():
         return from_dict(par_dict)
     # if default parameters bring in a new parameter
-    new_keys = set(default.keys()).difference(set(par_dict.keys()))
+    new_keys = [k for k in default if k not in par_dict]
     for nk in new_keys:
         par_dict[nk] = default[nk]
     # write the new parameter file with the extra param
@@ -86,5 +106,15 @@ def write(str_params, par):
     :return: None
     """
     pfile = getfile(str_params)
+    par = as_dict(par)
+    # do not re-write a parameter file that already contains the same parameters
+    try:
+        st = os.stat(pfile)
+        if st.st_size > 0 and _read_json(pfile, st.st_mtime_ns, st.st_size) == par:
+            return
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
     with open(pfile, 'w') as fil:
-        json.dump(as_dict(par), fil, sort_keys=False, indent=4)
+        json.dump(par, fil, sort_keys=False, indent=4)
+    # coarse filesystem timestamps may leave mtime and size unchanged: drop the cached parse
+    _read_json.cache_clear()
@@ -22,6 +22,22 @@ from ibllib.misc import version
 logger_ = logging.getLogger('ibllib')
 
 
+def _find_raw_file(path, pattern):
+    """
+    Finds the first file matching the glob pattern in the raw data folder. The file name without
+    wildcard is by far the most common and a single stat is much cheaper than listing the folder.
+    Note that this name is therefore returned in priority over any other file matching the glob.
+
+    :param path: raw data folder
+    :param pattern: glob pattern, such as "_iblrig_taskData.raw*.jsonable"
+    :return: pathlib.Path or None if no file is found
+    """
+    candidate = path.joinpath(pattern.replace('*', ''))
+    if candidate.exists():
+        return candidate
+    return next(path.glob(pattern), None)
+
+
 def trial_times_to_times(raw_trial):
     """
     Parse and convert all trial timestamps to "absolute" time.
@@ -88,7 +104,7 @@ def load_data(session_path, time='absolute'):
     if session_path is None:
         return
     path = Path(session_path).joinpath("raw_behavior_data")
-    path = next(path.glob("_iblrig_taskData.raw*.jsonable"), None)
+    path = _find_raw_file(path, "_iblrig_taskData.raw*.jsonable")
     if not path:
         return None
     data = jsonable.read(path)
@@ -111,7 +127,7 @@ def load_settings(session_path):
     if session_path is None:
         return
     path = Path(session_path).joinpath("raw_behavior_data")
-    path = next(path.glob("_iblrig_taskSettings.raw*.json"), None)
+    path = _find_raw_file(path, "_iblrig_taskSettings.raw*.json")
     if not path:
         return None
     with open(path, 'r') as f:
@@ -183,7 +199,7 @@ def load_encoder_events(session_path, settings=False):
     if session_path is None:
         return
     path = Path(session_path).joinpath("raw_behavior_data")
-    path = next(path.glob("_iblrig_encoderEvents.raw*.ssv"), None)
+    path = _find_raw_file(path, "_iblrig_encoderEvents.raw*.ssv")
     if not settings:
         settings = load_settings(session_path)
     if settings is None or settings['IBLRIG_VERSION_TAG'] == '':
@@ -249,7 +265,7 @@ def load_encoder_positions(session_path, settings=False):
     if session_path is None:
         return
     path = Path(session_path).joinpath("raw_behavior_data")
-    path = next(path.glob("_iblrig_encoderPositions.raw*.ssv"), None)
+    path = _find_raw_file(path, "_iblrig_encoderPositions.raw*.ssv")
     if not settings:
         settings = load_settings(session_path)
     if settings is None or settings['IBLRIG_VERSION_TAG'] == '':
@@ -294,7 +310,7 @@ def load_encoder_trial_info(session_path):
     if session_path is None:
         return
     path = Path(session_path).joinpath("raw_behavior_data")
-    path = next(path.glob("_iblrig_encoderTrialInfo.raw*.ssv"), None)
+    path = _find_raw_file(path, "_iblrig_encoderTrialInfo.raw*.ssv")
     if not path:
         return None
     data = pd.read_csv(path, sep=' ', header=None)
@@ -323,7 +339,7 @@ def load_ambient_sensor(session_path):
     if session_path is None:
         return
     path = Path(session_path).joinpath("raw_behavior_data")
-    path = next(path.glob("_iblrig_ambientSensorData.raw*.jsonable"), None)
+    path = _find_raw_file(path, "_iblrig_ambientSensorData.raw*.jsonable")
     if not path:
         return None
     data = []
@@ -345,7 +361,7 @@ def load_mic(session_path):
     if session_path is None:
         return
     path = Path(session_path).joinpath("raw_behavior_data")
-    path = next(path.glob("_iblrig_micData.raw*.wav"), None)
+    path = _find_raw_file(path, "_iblrig_micData.raw*.wav")
     if not path:
         return None
     fp = wave.open(path)
@@ -402,7 +418,7 @@ def _groom_wheel_data_lt5(data, label='file ', path=''):
     nothing excludes getting new ones.
     """
     data = _clean_wheel_dataframe(data, label, path)
-    data.drop(data.loc[data.bns_ts.apply(len) != 33].index, inplace=True)
+    data.drop(data.loc[data.bns_ts.str.len() != 33].index, inplace=True)
     # check if the time scale is in ms
     sess_len_sec = (datetime.strptime(data['bns_ts'].iloc[-1][:25], '%Y-%m-%dT%H:%M:%S.%f') -
                     datetime.strptime(data['bns_ts'].iloc[0][:25], '%Y-%m-%dT%H:%M:%S.%f')).seconds
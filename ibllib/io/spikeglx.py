@@ -46,7 +46,7 @@ class Reader:
 
     @property
     def is_mtscomp(self):
-        return 'cbin' in self.file_bin.suffix and self.file_bin.with_suffix('.ch').exists()
+        return is_mtscomp(self.file_bin)
 
     @property
     def version(self):
@@ -139,20 +139,24 @@ class Reader:
         :param threshold: (V) threshold for front detection, defaults to 1.2 V
         :return: int8 array
         """
-        digital = self.read_sync_digital(_slice)
-        analog = self.read_sync_analog(_slice)
-        if analog is None:
-            return digital
-        analog[np.where(analog < threshold)] = 0
-        analog[np.where(analog >= threshold)] = 1
-        return np.concatenate((digital, np.int8(analog)), axis=1)
+        csel = _get_analog_sync_trace_indices_from_meta(self.meta) if self.meta else []
+        if not csel:
+            return self.read_sync_digital(_slice)
+        # read digital and analog sync traces in one go so compressed chunks are decoded once
+        dsel = _get_sync_trace_indices_from_meta(self.meta)
+        raw = self.data[_slice, dsel + csel]
+        digital = split_sync(raw[:, :len(dsel)])
+        analog = np.float32(raw[:, len(dsel):])
+        analog *= self.channel_conversion_sample2mv[self.type][csel]
+        return np.concatenate((digital, np.int8(analog >= threshold)), axis=1)
 
     def compress_file(self, keep_original=True, **kwargs):
         """
         Compresses
         :param keep_original: defaults True. If False, the original uncompressed file is deleted
          and the current spikeglx.Reader object is modified in place
-        :param kwargs:
+        :param kwargs: passed to mtscomp.compress, for example n_threads: chunks are compressed
+         in parallel on all CPUs by default
         :return: pathlib.Path of the compressed *.cbin file
         """
         file_out = self.file_bin.with_suffix('.cbin')
@@ -186,6 +190,17 @@ class Reader:
         return file_out
 
 
+def is_mtscomp(sglx_file):
+    """
+    Whether a binary file is mtscomp compressed, ie. a *.cbin file with its *.ch companion file
+
+    :param sglx_file: full path to the binary file
+    :return: bool
+    """
+    sglx_file = Path(sglx_file)
+    return 'cbin' in sglx_file.suffix and sglx_file.with_suffix('.ch').exists()
+
+
 def read(sglx_file, first_sample=0, last_sample=10000):
     """
     Function to read from a spikeglx binary file without instantiating the class.
@@ -14,26 +14,26 @@ dicts.
 import collections
 
 
-def iflatten(x):
-    result = []
-    for el in x:
-        if isinstance(el, collections.abc.Iterable) and not (
-                isinstance(el, str) or isinstance(el, dict)):
-            result.extend(iflatten(el))
-        else:
-            result.append(el)
-    return result
+def _iselement(el):
+    return not isinstance(el, collections.abc.Iterable) or isinstance(el, (str, dict))
 
 
 def gflatten(x):
-    def iselement(e):
-        return not(isinstance(e, collections.abc.Iterable) and not(
-            isinstance(el, str) or isinstance(el, dict)))
-    for el in x:
-        if iselement(el):
-            yield el
+    # depth-first traversal with an explicit stack of iterators rather than recursion
+    stack = [iter(x)]
+    while stack:
+        for el in stack[-1]:
+            if _iselement(el):
+                yield el
+            else:
+                stack.append(iter(el))
+                break
         else:
-            yield from gflatten(el)
+            stack.pop()
+
+
+def iflatten(x):
+    return list(gflatten(x))
 
 
 def flatten(x, generator=False):
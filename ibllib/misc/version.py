@@ -1,10 +1,16 @@
+import functools
+
 import pkg_resources
 
 
+@functools.lru_cache(maxsize=128)
+def _version_key(v):
+    # extractors compare the same few tags many times per session: cache the padded key
+    return ''.join(['{:03d}'.format(int(x)) for x in v.split('.')])
+
+
 def _compare_version_tag(v1, v2, fcn):
-    v1_ = ''.join(['{:03d}'.format(int(v)) for v in v1.split('.')])
-    v2_ = ''.join(['{:03d}'.format(int(v)) for v in v2.split('.')])
-    return fcn(v1_, v2_)
+    return fcn(_version_key(v1), _version_key(v2))
 
 
 def gt(v1, v2):
@@ -182,9 +182,11 @@ def compress_ephys(root_data_folder, dry=False, max_sessions=5):
                 bin_file = ef.get(typ)
                 if not bin_file:
                     continue
+                # already compressed files are skipped without opening them
+                if spikeglx.is_mtscomp(bin_file):
+                    continue
                 sr = spikeglx.Reader(bin_file)
-                if not sr.is_mtscomp:
-                    out_files.append(sr.compress_file(keep_original=False))
+                out_files.append(sr.compress_file(keep_original=False))
         qcflag.unlink()
         if out_files:
             session_path = probe_path.parents[1]
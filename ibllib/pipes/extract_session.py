@@ -14,9 +14,6 @@ import json
 from pathlib import Path
 
 from ibllib.misc import log2session_static
-from ibllib.io.extractors import (ephys_trials, ephys_fpga,
-                                  biased_wheel, biased_trials,
-                                  training_trials, training_wheel)
 from ibllib.io import raw_data_loaders as raw
 import ibllib.io.flags as flags
 
@@ -67,14 +64,16 @@ def get_task_extractor_type(task_name):
         return 'sync_ephys'
 
 
-def get_session_extractor_type(session_path):
+def get_session_extractor_type(session_path, settings=False):
     """
     From a session path, loads the settings file, finds the task and checks if extractors exist
     task names examples:
     :param session_path:
+    :param settings: (False) settings dictionary, if already loaded
     :return: bool
     """
-    settings = raw.load_settings(session_path)
+    if not settings:
+        settings = raw.load_settings(session_path)
     if settings is None:
         logger_.error(f'ABORT: No data found in "raw_behavior_data" folder {session_path}')
         return False
@@ -104,30 +103,35 @@ def from_path(session_path, force=False, save=True):
     :param save: (True) boolean or list of ALF file names to extract
     :return: None
     """
-    extractor_type = get_session_extractor_type(session_path)
+    # the settings are loaded once and forwarded to all extractors
+    settings = raw.load_settings(session_path)
+    extractor_type = get_session_extractor_type(session_path, settings=settings)
     logger_.info(f"Extracting {session_path} as {extractor_type}")
     if is_extracted(session_path) and not force:
         logger_.info(f"Session {session_path} already extracted.")
         return
-    if extractor_type == 'training':
-        settings, data = raw.load_bpod(session_path)
-        logger_.info('training session on ' + settings['PYBPOD_BOARD'])
-        training_trials.extract_all(session_path, data=data, save=save)
-        training_wheel.extract_all(session_path, bp_data=data, save=save)
-        logger_.info('session extracted \n')  # timing info in log
-    if extractor_type == 'biased':
-        settings, data = raw.load_bpod(session_path)
-        logger_.info('biased session on ' + settings['PYBPOD_BOARD'])
-        biased_trials.extract_all(session_path, data=data, save=save)
-        biased_wheel.extract_all(session_path, bp_data=data, save=save)
+    # the extractors are imported on demand as most users of this module only need the task type
+    if extractor_type in ('training', 'biased'):
+        from ibllib.io.extractors import (biased_wheel, biased_trials,
+                                          training_trials, training_wheel)
+        # extractor type: (trials extractor, wheel extractor) for Bpod-only sessions
+        bpod_extractors = {'training': (training_trials, training_wheel),
+                           'biased': (biased_trials, biased_wheel)}
+        trials_extractor, wheel_extractor = bpod_extractors[extractor_type]
+        data = raw.load_data(session_path)
+        logger_.info(f"{extractor_type} session on {settings['PYBPOD_BOARD']}")
+        trials_extractor.extract_all(session_path, data=data, settings=settings, save=save)
+        wheel_extractor.extract_all(session_path, bp_data=data, save=save)
         logger_.info('session extracted \n')  # timing info in log
     if extractor_type == 'ephys':
+        from ibllib.io.extractors import ephys_trials, ephys_fpga
         data = raw.load_data(session_path)
         logger_.info('extract BPOD for ephys session')
         ephys_trials.extract_all(session_path, data=data, save=save)
         logger_.info('extract FPGA information for ephys session')
         ephys_fpga.extract_all(session_path, save=save)
     if extractor_type == 'sync_ephys':
+        from ibllib.io.extractors import ephys_fpga
         ephys_fpga.extract_sync(session_path, save=save)
 
 
@@ -10,11 +10,14 @@ Purge data from RIG
 sessions and files on Flatiron
 - Delete local raw file if found on Flatiron
 """
+from concurrent.futures import ThreadPoolExecutor
 from alf.folders import session_name
 from pathlib import Path
 from oneibl.one import ONE
 import argparse
 
+UNLINK_THREADS = 16
+
 
 def purge_local_data(local_folder, file_name, lab=None, dry=False):
     # Figure out datasetType from file_name or file path
@@ -43,16 +46,16 @@ def purge_local_data(local_folder, file_name, lab=None, dry=False):
     to_remove = []
     for f in files:
         sess_name = session_name(f)
-        for u in urls:
-            if sess_name in u:
-                to_remove.append(f)
+        if any(sess_name in u for u in urls):
+            to_remove.append(f)
     print(f'Local files to remove: {len(to_remove)}')
     for f in to_remove:
         print(f)
-        if dry:
-            continue
-        else:
-            f.unlink()
+    if dry:
+        return
+    # deletions are latency bound on network drives, issue them concurrently
+    with ThreadPoolExecutor(max_workers=UNLINK_THREADS) as executor:
+        list(executor.map(Path.unlink, to_remove))
     return
 
 
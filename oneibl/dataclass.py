@@ -2,8 +2,6 @@ from functools import singledispatch
 from dataclasses import dataclass, field, fields
 from pathlib import Path
 
-from ibllib.misc import flatten
-
 
 @dataclass
 class SessionDataInfo:
@@ -80,5 +78,5 @@ def _session_details_to_dataclasses(ses_info, **kwargs):
 
 @_session_details_to_dataclasses.register(list)
 def _(ses_info: list, **kwargs):
-    dsets = flatten([ses['data_dataset_session_related'] for ses in ses_info])
+    dsets = [d for ses in ses_info for d in ses['data_dataset_session_related']]
     return SessionDataInfo.from_datasets(dsets, **kwargs)
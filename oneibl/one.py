@@ -1,9 +1,12 @@
 from pathlib import Path, PurePath
 import requests
+import copy
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from ibllib.misc import pprint
+from ibllib.misc import pprint, print_progress
 from ibllib.io.one import OneAbstract
 from alf.io import load_file_content, remove_uuid_file, is_uuid_string
 
@@ -13,6 +16,8 @@ import oneibl.params
 
 logger_ = logging.getLogger('ibllib')
 
+DOWNLOAD_THREADS = 4  # number of files downloaded concurrently, 1 downloads sequentially
+SESSION_CACHE_SECS = 60  # session details from Alyx are re-used during this time, 0 disables
 
 _ENDPOINTS = {  # keynames are possible input arguments and values are actual endpoints
     'data': 'dataset-types',
@@ -101,6 +106,7 @@ class ONE(OneAbstract):
                                   'IP addresses are filtered on IBL database servers. \n' +
                                   'Are you connecting from an IBL participating institution ?')
         print('Connected to ' + self._par.ALYX_URL + ' as ' + self._par.ALYX_LOGIN,)
+        self._cache_sessions = {}
         # Init connection to Globus if needed
 
     @property
@@ -176,7 +182,7 @@ class ONE(OneAbstract):
                 return dlist
 
         # get the session information
-        ses = self.alyx.rest('sessions', 'read', eid)
+        ses = self._get_session_details(eid)
 
         if keyword.lower() == 'all':
             return [ses]
@@ -205,7 +211,8 @@ class ONE(OneAbstract):
         :type cache_dir: str
         :param download_only: do not attempt to load data in memory, just download the files
         :type download_only: bool
-        :param clobber: force downloading even if files exists locally
+        :param clobber: force downloading even if files exists locally and re-query the session
+         datasets from Alyx rather than using the recently cached ones
         :type clobber: bool
         :param keep_uuid: keeps the UUID at the end of the filename (defaults to False)
         :type keep_uuid: bool
@@ -253,7 +260,7 @@ class ONE(OneAbstract):
         eid_str = eid[-36:]
         # get session json information as a dictionary from the alyx API
         try:
-            ses = self.alyx.get('/sessions/' + eid_str)
+            ses = self._get_session_details(eid_str, refresh=clobber)
         except requests.HTTPError:
             raise requests.HTTPError('Session ' + eid_str + ' does not exist')
         # ses = ses[0]
@@ -264,15 +271,39 @@ class ONE(OneAbstract):
         if not dataset_types or dataset_types == ['__all__']:
             dclass_output = True
         dc = SessionDataInfo.from_session_details(ses, dataset_types=dataset_types, eid=eid_str)
-        # loop over each dataset and download if necessary
-        for ind in range(len(dc)):
-            if dc.url[ind] and not dry_run:
-                relpath = PurePath(dc.url[ind].replace(self._par.HTTP_DATA_SERVER, '.')).parents[0]
-                cache_dir_file = PurePath(cache_dir, relpath)
-                Path(cache_dir_file).mkdir(parents=True, exist_ok=True)
-                dc.local_path[ind] = self._download_file(dc.url[ind], str(cache_dir_file),
-                                                         clobber=clobber, offline=offline,
-                                                         keep_uuid=keep_uuid)
+
+        if not dry_run:
+            inds = [ind for ind in range(len(dc)) if dc.url[ind]]
+            local_dirs = {ind: str(PurePath(cache_dir, PurePath(
+                dc.url[ind].replace(self._par.HTTP_DATA_SERVER, '.')).parent)) for ind in inds}
+            # datasets share a handful of folders: create each of them once, not once per file
+            for local_dir in set(local_dirs.values()):
+                Path(local_dir).mkdir(parents=True, exist_ok=True)
+            # only the files missing from the cache are transferred
+            to_download = [] if offline else [
+                ind for ind in inds
+                if self._is_missing(dc.url[ind], local_dirs[ind], clobber, keep_uuid)]
+            parallel = DOWNLOAD_THREADS > 1 and len(to_download) > 1
+
+            # download each dataset if necessary
+            def download_dataset(ind):
+                return self._download_file(dc.url[ind], local_dirs[ind], clobber=clobber,
+                                           offline=offline, keep_uuid=keep_uuid, silent=parallel)
+
+            local_paths = {}
+            # transfers are latency bound so downloading several files at once saves time
+            if parallel:
+                # per-file progress bars would interleave: report the files completed instead
+                with ThreadPoolExecutor(max_workers=DOWNLOAD_THREADS) as executor:
+                    results = executor.map(download_dataset, to_download)
+                    for i, (ind, local_path) in enumerate(zip(to_download, results)):
+                        local_paths[ind] = local_path
+                        print_progress(i, len(to_download), prefix='Downloading ' + eid_str,
+                                       suffix=f'{i + 1}/{len(to_download)} files')
+            for ind in inds:
+                if ind not in local_paths:
+                    local_paths[ind] = download_dataset(ind)
+                dc.local_path[ind] = local_paths[ind]
         # load the files content in variables if requested
         if not download_only:
             for ind, fil in enumerate(dc.local_path):
@@ -281,20 +312,47 @@ class ONE(OneAbstract):
         if dclass_output:
             return dc
         # if required, parse the output as a list that matches dataset_types requested
+        # index the datasets by type once rather than scanning the list for each type requested
+        dtype_inds = {}
+        for i, x in enumerate(dc.dataset_type):
+            dtype_inds.setdefault(x, []).append(i)
         list_out = []
         for dt in dataset_types:
-            if dt not in dc.dataset_type:
+            if dt not in dtype_inds:
                 logger_.warning('dataset ' + dt + ' not found for session: ' + eid_str)
                 list_out.append(None)
                 continue
-            for i, x, in enumerate(dc.dataset_type):
-                if dt == x:
-                    if dc.data[i] is not None:
-                        list_out.append(dc.data[i])
-                    else:
-                        list_out.append(dc.local_path[i])
+            for i in dtype_inds[dt]:
+                if dc.data[i] is not None:
+                    list_out.append(dc.data[i])
+                else:
+                    list_out.append(dc.local_path[i])
         return list_out
 
+    def _get_session_details(self, eid, refresh=False):
+        """
+        Queries Alyx for the session details. The response is kept for SESSION_CACHE_SECS so that
+        successive list and load calls on the same session query the database only once.
+
+        :param eid: session UUID string or session URL
+        :param refresh: (False) if True, query Alyx even if the session details are cached, for
+         example when loading with clobber=True after registering new datasets
+        :return: dictionary of session details as per the REST response. This is a copy so
+         that callers may modify it without altering the cached response
+        """
+        eid = eid.split('/')[-1]
+        now = time.time()
+        if eid in self._cache_sessions and not refresh:
+            t, ses = self._cache_sessions[eid]
+            if now - t < SESSION_CACHE_SECS:
+                return copy.deepcopy(ses)
+        ses = self.alyx.get('/sessions/' + eid)
+        # drop expired entries so the cache does not grow with each session ever queried
+        self._cache_sessions = {k: v for k, v in self._cache_sessions.items()
+                                if now - v[0] < SESSION_CACHE_SECS}
+        self._cache_sessions[eid] = (now, ses)
+        return copy.deepcopy(ses)
+
     def _ls(self, table=None, verbose=False):
         """
         Queries the database for a list of 'users' and/or 'dataset-types' and/or 'subjects' fields
@@ -405,17 +463,32 @@ class ONE(OneAbstract):
             cache_dir = str(PurePath(Path.home(), "Downloads", "FlatIron"))
         return cache_dir
 
-    def _download_file(self, url, cache_dir, clobber=False, offline=False, keep_uuid=False):
+    @staticmethod
+    def _local_path(url, cache_dir, keep_uuid=False):
         local_path = cache_dir + os.sep + os.path.basename(url)
         if not keep_uuid:
             local_path = remove_uuid_file(local_path, dry=True)
+        return local_path
+
+    def _is_missing(self, url, cache_dir, clobber=False, keep_uuid=False):
+        """
+        Whether _download_file will transfer the file, as opposed to return a cached copy
+        """
+        if Path(self._local_path(url, cache_dir, keep_uuid)).exists():
+            return False
+        return clobber or not os.path.exists(cache_dir + os.sep + os.path.basename(url))
+
+    def _download_file(self, url, cache_dir, clobber=False, offline=False, keep_uuid=False,
+                       silent=False):
+        local_path = self._local_path(url, cache_dir, keep_uuid)
         if not Path(local_path).exists():
             local_path = wc.http_download_file(url,
                                                username=self._par.HTTP_DATA_SERVER_LOGIN,
                                                password=self._par.HTTP_DATA_SERVER_PWD,
                                                cache_dir=str(cache_dir),
                                                clobber=clobber,
-                                               offline=offline)
+                                               offline=offline,
+                                               silent=silent)
         if keep_uuid:
             return local_path
         else:
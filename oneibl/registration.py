@@ -1,6 +1,8 @@
 from pathlib import Path
 import json
+import re
 import datetime
+import itertools
 import logging
 from dateutil import parser as dateparser
 
@@ -32,6 +34,7 @@ class RegistrationClient:
         if not one:
             self.one = ONE()
         self.dtypes = self.one.alyx.rest('dataset-types', 'list')
+        self._dtypes_regex = _dtypes_regex(self.dtypes)
         self.file_extensions = [df['file_extension'] for df in
                                 self.one.alyx.rest('data-formats', 'list')]
 
@@ -210,13 +213,23 @@ class RegistrationClient:
             self.one.alyx.post('/register-file', data=r_)
 
     def _match_filename_dtypes(self, full_file):
-        import re
-        patterns = [dt['filename_pattern'] for dt in self.dtypes if dt['filename_pattern']]
-        for pat in patterns:
-            reg = pat.replace('.', r'\.').replace('_', r'\_').replace('*', r'.*')
-            if re.match(reg, Path(full_file).name, re.IGNORECASE):
-                return True
-        return False
+        if self._dtypes_regex is None:
+            return False
+        return bool(self._dtypes_regex.match(Path(full_file).name))
+
+
+def _dtypes_regex(dtypes):
+    """
+    Compiles the filename patterns of all dataset types into a single regular expression, so that
+    each file is matched in one pass rather than against each pattern in turn
+    :param dtypes: list of dataset types dictionaries as per the REST response
+    :return: compiled regular expression or None if no dataset type has a filename pattern
+    """
+    patterns = [dt['filename_pattern'] for dt in dtypes if dt['filename_pattern']]
+    if not patterns:
+        return
+    regs = [pat.replace('.', r'\.').replace('_', r'\_').replace('*', r'.*') for pat in patterns]
+    return re.compile('|'.join(f'(?:{reg})' for reg in regs), re.IGNORECASE)
 
 
 def _register_bool(fn, file_list):
@@ -306,9 +319,6 @@ def _glob_session(ses_path):
     """
     Glob for files to be registered on an IBL session
     :param ses_path: pathlib.Path of the session
-    :return: a list of files to potentially be registered
+    :return: a generator of files to potentially be registered
     """
-    fl = []
-    for gp in REGISTRATION_GLOB_PATTERNS:
-        fl.extend(list(ses_path.glob(gp)))
-    return fl
+    return itertools.chain.from_iterable(ses_path.glob(gp) for gp in REGISTRATION_GLOB_PATTERNS)
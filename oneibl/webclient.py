@@ -27,7 +27,7 @@ def http_download_file_list(links_to_file_list, **kwargs):
 
 
 def http_download_file(full_link_to_file, *, clobber=False, offline=False,
-                       username='', password='', cache_dir=''):
+                       username='', password='', cache_dir='', silent=False):
     """
     :param full_link_to_file: http link to the file.
     :type full_link_to_file: str
@@ -40,6 +40,9 @@ def http_download_file(full_link_to_file, *, clobber=False, offline=False,
     :param cache_dir: [''] directory in which files are cached; defaults to user's
      Download directory.
     :type cache_dir: str
+    :param silent: [False] If True, do not print the download progress, for example when several
+     files are downloaded concurrently.
+    :type silent: bool
 
     :return: (str) a list of the local full path of the downloaded files.
     """
@@ -70,15 +73,16 @@ def http_download_file(full_link_to_file, *, clobber=False, offline=False,
     # Create an authentication handler using the password manager
     auth = urllib.request.HTTPBasicAuthHandler(manager)
 
-    # Create an opener that will replace the default urlopen method on further calls
+    # Create an opener for this request only: the global urlopen is not modified so that
+    # several files can be downloaded concurrently
     opener = urllib.request.build_opener(auth)
-    urllib.request.install_opener(opener)
 
     # Open the url and get the length
-    u = urllib.request.urlopen(full_link_to_file)
+    u = opener.open(full_link_to_file)
     file_size = int(u.getheader('Content-length'))
 
-    print(f"Downloading: {file_name} Bytes: {file_size}")
+    if not silent:
+        print(f"Downloading: {file_name} Bytes: {file_size}")
     file_size_dl = 0
     block_sz = 8192 * 64 * 8
     f = open(file_name, 'wb')
@@ -88,7 +92,8 @@ def http_download_file(full_link_to_file, *, clobber=False, offline=False,
             break
         file_size_dl += len(buffer)
         f.write(buffer)
-        print_progress(file_size_dl, file_size, prefix='', suffix='')
+        if not silent:
+            print_progress(file_size_dl, file_size, prefix='', suffix='')
     f.close()
 
     return file_name
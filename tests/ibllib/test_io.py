@@ -8,6 +8,7 @@ import shutil
 import numpy as np
 
 from ibllib.io import params, flags, jsonable, spikeglx
+from ibllib.io import raw_data_loaders as raw
 
 
 class TestsParams(unittest.TestCase):
@@ -63,6 +64,42 @@ class TestsParams(unittest.TestCase):
         # even if this default is a Params named tuple
         par = params.read(pstring, default=par)
         self.assertEqual(par, params.from_dict(default))
+        # an empty parfile behaves as a non-existing one
+        Path(params.getfile(pstring)).touch()
+        try:
+            self.assertIsNone(params.read(pstring))
+            self.assertEqual(params.read(pstring, default=default), params.from_dict(default))
+        finally:
+            os.remove(params.getfile(pstring))
+
+    def test_read_after_write(self):
+        # the parsed file is cached, make sure a re-written file is read again
+        par = params.read('toto')
+        params.write('toto', par.set('A', 'tatatata'))
+        self.assertEqual(params.read('toto').A, 'tatatata')
+        # same size re-write with an unchanged mtime, as happens with coarse timestamps
+        pfile = params.getfile('toto')
+        os.utime(pfile, ns=(10 ** 9, 10 ** 9))
+        self.assertEqual(params.read('toto').A, 'tatatata')
+        params.write('toto', par.set('A', 'titititi'))
+        os.utime(pfile, ns=(10 ** 9, 10 ** 9))
+        self.assertEqual(params.read('toto').A, 'titititi')
+        # and that mutating the returned parameters doesn't affect the next read
+        par = params.read('toto', default={'new_key': 1})
+        self.assertEqual(par.new_key, 1)
+        self.assertEqual(params.read('toto').as_dict(), par.as_dict())
+        par.liste.append('mutated')
+        self.assertEqual(params.read('toto').liste, [1, 'turlu'])
+
+    def test_write_unchanged(self):
+        # writing the same parameters again leaves the file untouched
+        pfile = Path(params.getfile('toto'))
+        os.utime(pfile, ns=(0, 0))
+        params.write('toto', self.par_dict)
+        self.assertEqual(pfile.stat().st_mtime_ns, 0)
+        params.write('toto', {**self.par_dict, 'num': 16})
+        self.assertNotEqual(pfile.stat().st_mtime_ns, 0)
+        self.assertEqual(params.read('toto').num, 16)
 
     def tearDown(self):
         # at last delete the param file
@@ -131,6 +168,21 @@ class TestsRawDataLoaders(unittest.TestCase):
         flags.write_flag_file(self.tempfile.name, file_list=True)
         self.assertEqual(flags.read_flag_file(self.tempfile.name), True)
 
+    def testFindRawFile(self):
+        pattern = '_iblrig_taskData.raw*.jsonable'
+        with tempfile.TemporaryDirectory() as tdir:
+            tdir = Path(tdir)
+            # empty folder
+            self.assertIsNone(raw._find_raw_file(tdir, pattern))
+            # only a variant name exists: found by the glob
+            variant = tdir.joinpath('_iblrig_taskData.raw_v2.jsonable')
+            variant.touch()
+            self.assertEqual(raw._find_raw_file(tdir, pattern), variant)
+            # the canonical name takes priority over the other matches
+            canonical = tdir.joinpath('_iblrig_taskData.raw.jsonable')
+            canonical.touch()
+            self.assertEqual(raw._find_raw_file(tdir, pattern), canonical)
+
     def tearDown(self):
         self.tempfile.close()
 
@@ -270,6 +322,8 @@ class TestsSpikeGLX_compress(unittest.TestCase):
         self.file_cbin = self.sr.compress_file()
         self.sc = spikeglx.Reader(self.file_cbin)
         self.assertTrue(self.sc.is_mtscomp)
+        self.assertTrue(spikeglx.is_mtscomp(self.file_cbin))
+        self.assertFalse(spikeglx.is_mtscomp(self.file_bin))
         compare_data(sr_ref, self.sc)
 
         # test decompression in-place
@@ -363,6 +417,9 @@ class TestsSpikeGLX_Meta(unittest.TestCase):
         else:
             s = sr.read_sync()
             self.assertTrue(s.shape[1] == 17)
+            a = sr.read_sync_analog()
+            self.assertTrue(np.all(s[:, :16] == sr.read_sync_digital()))
+            self.assertTrue(np.all(s[:, 16:] == (a >= 1.2)))
         self.tdir.cleanup()
 
     def testGetRevisionAndType(self):
@@ -5,6 +5,7 @@ import tempfile
 from pathlib import Path
 
 from ibllib.misc import (version, print_progress, log2session, log2session_static)
+from ibllib.misc.flatten import flatten
 
 
 class TestLog2Session(unittest.TestCase):
@@ -62,6 +63,20 @@ class TestPrintProgress(unittest.TestCase):
             print_progress(p, 9)
 
 
+class TestFlatten(unittest.TestCase):
+
+    def test_flatten(self):
+        x = (1, 2, 3, [1, 2], 'string', 0.1, {1: None}, [[1, 2, 3], {1: 1}, 1], [], [[[4]]])
+        expected = [1, 2, 3, 1, 2, 'string', 0.1, {1: None}, 1, 2, 3, {1: 1}, 1, 4]
+        self.assertEqual(flatten(x), expected)
+        self.assertEqual(list(flatten(x, generator=True)), expected)
+        # deep nesting doesn't hit the recursion limit
+        x = [0]
+        for i in range(5000):
+            x = [x, i + 1]
+        self.assertEqual(flatten(x), list(range(5001)))
+
+
 class TestVersionTags(unittest.TestCase):
 
     def test_compare_version_tags(self):
@@ -44,3 +44,15 @@ class TestSearch(unittest.TestCase):
         dcall.append(self.dce)
         self.assertEqual(dcall.dataset_type, [self.dc1.dataset_type, None])
         self.assertEqual(dcall.data, [self.dc1.data, None])
+
+    def test_from_session_details_list(self):
+        ses_info = []
+        for i in range(2):
+            dsets = [{'data_url': f'http://server/sub/2019-01-01/00{i}/alf/_ibl_trials.{d}.npy',
+                      'dataset_type': f'trials.{d}',
+                      'id': f'uuid{i}{d}'} for d in ('choice', 'goCue_times')]
+            ses_info.append({'data_dataset_session_related': dsets})
+        dc = SessionDataInfo.from_session_details(ses_info)
+        self.assertEqual(len(dc), 4)
+        self.assertEqual(dc.dataset_id, ['uuid0choice', 'uuid0goCue_times',
+                                         'uuid1choice', 'uuid1goCue_times'])
@@ -1,9 +1,18 @@
 import unittest
+from unittest import mock
+import contextlib
+import io
+import random
+import tempfile
+import time
+import uuid
 import numpy as np
 import requests
 from pathlib import Path
 
 from alf.io import remove_uuid_file
+from brainbox.core import Bunch
+import oneibl.one
 from oneibl.one import ONE
 
 
@@ -226,5 +235,94 @@ class TestMisc(unittest.TestCase):
         self.assertEqual(_validate_date_range(val), val)
 
 
+class _AlyxStub:
+    """Returns the same session details for any session and counts the queries"""
+
+    def __init__(self, ses):
+        self.ses = ses
+        self.queries = []
+
+    def get(self, rest_query):
+        self.queries.append(rest_query)
+        return self.ses
+
+
+class TestOneOffline(unittest.TestCase):
+    """ONE load and list logic against a stub Alyx client and file server"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.eid = str(uuid.uuid4())
+        self.dtypes = ['a.b' + str(i) for i in range(3)]
+        dsets = [{'dataset_type': dt, 'id': str(uuid.uuid4()),
+                  'data_url': f'https://srv/lab/Subjects/s/2019-01-01/001/alf/{dt}.{uuid.uuid4()}'
+                              f'.npy'} for dt in self.dtypes]
+        self.alyx = _AlyxStub({'url': 'https://alyx/sessions/' + self.eid, 'subject': 's',
+                               'data_dataset_session_related': dsets})
+        self.one = ONE.__new__(ONE)
+        self.one._alyxClient = self.alyx
+        self.one._par = Bunch({'HTTP_DATA_SERVER': 'https://srv', 'CACHE_DIR': self.tmp.name,
+                               'HTTP_DATA_SERVER_LOGIN': '', 'HTTP_DATA_SERVER_PWD': ''})
+        self.one._cache_sessions = {}
+        self.downloads = []
+
+    def _http_download_file(self, url, cache_dir='', offline=False, silent=False, **kwargs):
+        file_name = Path(cache_dir).joinpath(Path(url).name)
+        if offline:
+            return str(file_name)
+        # finish in random order to check the outputs still match the inputs
+        time.sleep(random.random() / 50)
+        self.downloads.append((url, silent))
+        file_name.touch()
+        return str(file_name)
+
+    def _load(self, dataset_types, **kwargs):
+        with mock.patch('oneibl.webclient.http_download_file', self._http_download_file):
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                out = self.one.load(self.eid, dataset_types=dataset_types, download_only=True,
+                                    **kwargs)
+        return out, stdout.getvalue()
+
+    def test_load_download(self):
+        dtypes = self.dtypes[::-1]
+        files, stdout = self._load(dtypes)
+        self.assertEqual([Path(f).name for f in files], [dt + '.npy' for dt in dtypes])
+        self.assertTrue(all(Path(f).exists() for f in files))
+        # concurrent downloads don't print per file, only the aggregate progress
+        self.assertEqual(len(self.downloads), 3)
+        self.assertTrue(all(silent for _, silent in self.downloads))
+        self.assertEqual(stdout.count('Downloading ' + self.eid), 3)
+        # a cached load neither transfers nor prints anything
+        self.downloads = []
+        self.assertEqual(self._load(dtypes), (files, ''))
+        self.assertEqual(self.downloads, [])
+
+    def test_load_offline(self):
+        files, stdout = self._load(self.dtypes, offline=True)
+        self.assertEqual(stdout, '')
+        self.assertEqual(self.downloads, [])
+        self.assertTrue(not any(Path(f).exists() for f in files))
+
+    def test_session_details_cache(self):
+        url = 'https://alyx/sessions/' + self.eid
+        # hit within the cache duration, a url and a bare uuid share the same entry
+        self.assertEqual(self.one.list(url, 'subject'), 's')
+        self.assertEqual(self.one.list(self.eid, 'subject'), 's')
+        self.assertEqual(self.alyx.queries, ['/sessions/' + self.eid])
+        # a mutated result does not leak into the next call
+        self.one.list(self.eid, 'all')[0]['subject'] = 'mutated'
+        self.assertEqual(self.one.list(self.eid, 'subject'), 's')
+        self.assertEqual(len(self.alyx.queries), 1)
+        # loading with clobber re-queries the session
+        self._load(self.dtypes, clobber=True)
+        self.assertEqual(len(self.alyx.queries), 2)
+        # expired entries are re-queried
+        with mock.patch('oneibl.one.time.time',
+                        return_value=time.time() + oneibl.one.SESSION_CACHE_SECS + 1):
+            self.assertEqual(self.one.list(self.eid, 'subject'), 's')
+        self.assertEqual(len(self.alyx.queries), 3)
+
+
 if __name__ == '__main__':
     unittest.main(exit=False)
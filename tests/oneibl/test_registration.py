@@ -0,0 +1,34 @@
+import unittest
+
+from oneibl import registration
+
+
+class TestDtypesRegex(unittest.TestCase):
+
+    def setUp(self):
+        self.dtypes = [{'name': 'trials.choice', 'filename_pattern': '_ibl_trials.choice*'},
+                       {'name': 'wheel.position', 'filename_pattern': '*wheel.position.*'},
+                       {'name': 'no pattern', 'filename_pattern': ''},
+                       {'name': 'null pattern', 'filename_pattern': None}]
+
+    def test_match(self):
+        reg = registration._dtypes_regex(self.dtypes)
+        # case insensitive
+        self.assertTrue(reg.match('_IBL_trials.Choice.npy'))
+        # wildcards
+        self.assertTrue(reg.match('_ibl_trials.choice.npy'))
+        self.assertTrue(reg.match('_ibl_trials.choice'))
+        # a name that only matches the second pattern
+        self.assertTrue(reg.match('_ibl_wheel.position.npy'))
+        self.assertFalse(reg.match('_ibl_wheel.position'))
+        # the dots are literal and the patterns are anchored at the start of the name
+        self.assertFalse(reg.match('_ibl_trialsXchoice.npy'))
+        self.assertFalse(reg.match('alf_ibl_trials.choice.npy'))
+
+    def test_no_patterns(self):
+        self.assertIsNone(registration._dtypes_regex(self.dtypes[2:]))
+        self.assertIsNone(registration._dtypes_regex([]))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=False)